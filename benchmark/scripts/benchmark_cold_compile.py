@@ -9,6 +9,7 @@ import argparse
 from collections import OrderedDict
 import os
 import numbers
+import csv
 
 # Currently hardcoded
 def get_firrtl_repo():
@@ -35,50 +36,62 @@ def time():
     if platform == 'linux':
         return ['/usr/bin/time', '-v']
 
-def extract_max_size(output):
-    regex = ''
-    if platform == 'macos':
-        regex = '(\d+)\s+maximum resident set size'
-    if platform == 'linux':
-        regex = 'Maximum resident set size[^:]*:\s+(\d+)'
-
-    m = re.search(regex, output, re.MULTILINE)
-    if m :
-        return int(m.group(1))
-    else :
+# Patterns for parsing lines of /usr/bin/time output, compiled once per platform
+max_size_re = {
+    'macos': re.compile(r'(\d+)\s+maximum resident set size'),
+    'linux': re.compile(r'Maximum resident set size[^:]*:\s+(\d+)')
+}[platform]
+search_max_size = max_size_re.search
+
+# The runtime sits on a fixed-format line, so no regex is needed
+# MacOS: "        1.23 real         0.50 user         0.10 sys"
+def extract_run_time_macos(line):
+    fields = line.split()
+    if len(fields) >= 2 and fields[1] == 'real':
+        return float(fields[0])
+    return None
+
+# Linux: "\tElapsed (wall clock) time (h:mm:ss or m:ss): 1:02.03"
+def extract_run_time_linux(line):
+    if 'Elapsed (wall clock) time' in line:
+        parts = line.rsplit(' ', 1)[1].split(':')
+        seconds = float(parts[-1])
+        if len(parts) >= 2:
+            seconds += float(parts[-2]) * 60
+        if len(parts) == 3:
+            seconds += float(parts[-3]) * 3600
+        return seconds
+    return None
+
+extract_run_time = {
+    'macos': extract_run_time_macos,
+    'linux': extract_run_time_linux
+}[platform]
+
+# Single pass over the output, stopping once both values have been found
+def extract_stats(output):
+    size = None
+    runtime = None
+    for line in output.splitlines():
+        m = search_max_size(line) if size is None else None
+        if m :
+            size = int(m.group(1))
+        elif runtime is None:
+            runtime = extract_run_time(line)
+        if size is not None and runtime is not None:
+            return (size, runtime)
+    if size is None:
         raise Exception('Max set size not found!')
-
-def extract_run_time(output):
-    regex = ''
-    res = None
-    if platform == 'macos':
-        regex = '(\d+\.\d+)\s+real'
-    if platform == 'linux':
-        regex = 'Elapsed \(wall clock\) time \(h:mm:ss or m:ss\): ([0-9:.]+)'
-    m = re.search(regex, output, re.MULTILINE)
-    if m :
-        text = m.group(1)
-        if platform == 'macos':
-            return float(text)
-        if platform == 'linux':
-            parts = text.split(':')
-            if len(parts) == 3:
-                return float(parts[0]) * 3600 + float(parts[1]) * 60 + float(parts[0])
-            if len(parts) == 2:
-                return float(parts[0]) * 60 + float(parts[1])
     raise Exception('Runtime not found!')
 
 def run_firrtl(java, jar, design):
     java_cmd = java.split()
     cmd = time() + java_cmd + ['-cp', jar, 'firrtl.stage.FirrtlMain', '-i', design,'-o','out.v','-X','verilog']
-    result = subprocess.run(cmd, stderr=subprocess.PIPE, stdout=subprocess.PIPE)
+    result = subprocess.run(cmd, stderr=subprocess.PIPE, stdout=subprocess.DEVNULL)
     if result.returncode != 0 :
-        print(result.stdout)
-        print(result.stderr)
+        print(result.stderr.decode('utf-8', 'replace'))
         sys.exit(1)
-    size = extract_max_size(result.stderr.decode('utf-8'))
-    runtime = extract_run_time(result.stderr.decode('utf-8'))
-    return (size, runtime)
+    return extract_stats(result.stderr.decode('utf-8'))
 
 def parseargs():
     parser = argparse.ArgumentParser("Benchmark FIRRTL")
@@ -171,9 +184,9 @@ def main():
                 java_title = ''
                 revision = ''
 
-    for line in info:
-        formated = ['{:0.2f}'.format(elt) if isinstance(elt, numbers.Real) else elt for elt in line]
-        print(','.join(formated))
+    writer = csv.writer(sys.stdout, lineterminator='\n')
+    writer.writerows(['{:0.2f}'.format(elt) if isinstance(elt, numbers.Real) else elt for elt in line]
+                     for line in info)
 
 if __name__ == '__main__':
     main()
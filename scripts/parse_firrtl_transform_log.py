@@ -13,24 +13,29 @@ start_xform_re = re.compile(r'\s*=+\s+Starting\s+Transform\s+(\S+)\s+=+\s*')
 finish_xform_re = re.compile(r'\s*=+\s+Finished\s+Transform\s+(\S+)\s+=+\s*')
 time_re = re.compile(r'\s*Time:\s*(\d+(\.\d+)?)\s*ms\s*')
 
+# Bound once since they are called for every line of the log
+match_start = start_xform_re.match
+match_finish = finish_xform_re.match
+match_time = time_re.match
+
 
 def get_start(line):
     if line is not None:
-        m = start_xform_re.match(line)
+        m = match_start(line)
         if m:
             return m.group(1)
     return None
 
 
 def get_finish(line):
-    m = finish_xform_re.match(line)
+    m = match_finish(line)
     if m:
         return m.group(1)
     return None
 
 
 def get_time(line):
-    m = time_re.match(line)
+    m = match_time(line)
     if m:
         return m.group(1)
     return None
@@ -73,7 +78,7 @@ def read_transform(name, lines):
 
 def read_top_transform(it):
     # Find start
-    lines = dropwhile(lambda line: not start_xform_re.match(line), it)
+    lines = dropwhile(lambda line: not match_start(line), it)
     name = get_start(safe_next(lines))
     if name is not None:
         return read_transform(name, lines)